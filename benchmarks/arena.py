@@ -0,0 +1,53 @@
+# run from the repository root: PYTHONPATH=. python benchmarks/arena.py
+import contextlib
+import gc
+import random
+import time
+from engine.arena import Arena
+from engine.loss import MSELoss
+from main import MLPModel
+
+
+# time the garbage collections triggered while training
+class GCTimer:
+    def __init__(self) -> None:
+        self.pauses = []
+        self._start = 0.0
+
+    def __call__(self, phase, info) -> None:
+        if phase == "start":
+            self._start = time.perf_counter()
+        else:
+            self.pauses.append(time.perf_counter() - self._start)
+
+
+# train for a number of steps, returning the step time and the gc pauses
+def run(steps: int, arena: bool):
+    random.seed(0)
+    model, criterion = MLPModel(), MSELoss()
+    x, y = [0.17, 0.70, 1.0], 0.25
+
+    timer = GCTimer()
+    gc.collect()
+    gc.callbacks.append(timer)
+
+    try:
+        with Arena() if arena else contextlib.nullcontext():
+            start = time.perf_counter()
+            for _ in range(steps):
+                model.zero_grad()
+                criterion(y, model(x))
+                criterion.backward()
+                model.update(0.0)
+            elapsed = time.perf_counter() - start
+    finally:
+        gc.callbacks.remove(timer)
+
+    return elapsed / steps, timer.pauses
+
+
+if __name__ == "__main__":
+    for arena in (False, True, False, True):
+        step, pauses = run(200, arena)
+        print(f"arena={arena}: {step * 1000:.2f} ms/step, {len(pauses)} collections, "
+              f"{sum(pauses) * 1000:.1f} ms total, {max(pauses, default=0) * 1000:.2f} ms max pause")
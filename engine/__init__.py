@@ -1 +1,2 @@
 from .node import Node
+from .arena import Arena
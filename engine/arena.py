@@ -0,0 +1,106 @@
+from typing import List
+from engine.node import Node, _leaf_backward
+
+
+class Arena:
+    def __init__(self, capacity: int = 0) -> None:
+        """
+        Initialize a pool of nodes reused by every training step.
+
+        While the arena is active, the nodes created by operations are taken from the pool instead of
+        being allocated. Resetting the arena (Module.zero_grad and leaving the with block do it)
+        releases every node taken since the last reset at once, so those nodes must not be used after
+        it. Forward passes that never call zero_grad, like inference, grow the pool until the next
+        reset, so callers running them inside an arena must call reset themselves.
+
+        :param capacity: The number of nodes to preallocate, the pool grows past it when needed
+        """
+        self._pool: List[Node] = [Node(0.0) for _ in range(capacity)]
+        self._used = 0
+        self._previous = None
+
+    # take a node from the pool
+    def allocate(self) -> Node:
+        """
+        Take the next free node from the pool, growing it if it is exhausted.
+
+        :return:
+            A node with its backward pass and children cleared
+        """
+        if self._used == len(self._pool):
+            self._pool.append(Node(0.0))
+
+        node = self._pool[self._used]
+        self._used += 1
+
+        return node
+
+    # release every node of the pool
+    def reset(self) -> None:
+        """
+        Release every node taken from the pool.
+
+        The closures and children of the released nodes are dropped, which breaks the reference
+        cycles between a node and its backward pass so they are freed without the cyclic garbage
+        collector.
+
+        :return:
+            None
+        """
+        for node in self._pool[:self._used]:
+            node._backward = _leaf_backward
+            node._children.clear()
+
+        self._used = 0
+
+    # activate the arena
+    def __enter__(self) -> "Arena":
+        """
+        Activate the arena, taking the nodes created by operations from it.
+
+        :return:
+            The arena
+        """
+        self._previous, Node._arena = Node._arena, self
+        return self
+
+    # deactivate the arena
+    def __exit__(self, *args) -> None:
+        """
+        Deactivate the arena, restoring the previously active one, and release its nodes.
+
+        :return:
+            None
+        """
+        Node._arena, self._previous = self._previous, None
+        self.reset()
+
+    # the number of nodes taken from the pool
+    def __len__(self) -> int:
+        """
+        Return the number of nodes taken from the pool since the last reset.
+
+        :return:
+            The number of nodes in use
+        """
+        return self._used
+
+    # string representation of the arena
+    def __str__(self) -> str:
+        """
+        Return the string representation of the arena.
+
+        :return:
+            The string representation of the arena
+        """
+        return f"Arena(used={self._used}, capacity={len(self._pool)})"
+
+    # string representation of the arena
+    def __repr__(self) -> str:
+        """
+        Return the string representation of the arena.
+
+        :return:
+            The string representation of the arena
+        """
+        return self.__str__()
@@ -0,0 +1 @@
+from .numpy_export import NumpyExporter
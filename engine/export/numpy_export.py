@@ -0,0 +1,117 @@
+from typing import List, Any, Dict, AnyStr
+from engine.nn.module import Module
+from engine.nn.linear import Linear
+from engine.nn.activation import ReLU, Tanh, GeLU
+import numpy as np
+import os
+
+
+# numpy source for each supported activation function
+_ACTIVATIONS: Dict[type, AnyStr] = {
+    ReLU: "np.maximum(0, x)",
+    Tanh: "np.tanh(x)",
+    GeLU: "0.5 * x * (1 + np.tanh(np.sqrt(2 / np.pi) * (x + 0.044715 * x ** 3)))",
+}
+
+# header of the generated forward module
+_HEADER = '''"""
+Generated by micronet. Standalone numpy forward pass, do not edit.
+"""
+import numpy as np
+import os
+
+with np.load(os.path.join(os.path.dirname(os.path.abspath(__file__)), "{weights}")) as _weights:
+    _arrays = {{name: _weights[name] for name in _weights.files}}
+'''
+
+
+class NumpyExporter:
+    def __init__(self, model: Module) -> None:
+        """
+        Initialize the exporter.
+
+        :param model: The trained module to export
+        """
+        self.model = model
+
+    # collect the weights of every linear layer in the module
+    def weights(self) -> Dict[AnyStr, np.ndarray]:
+        """
+        Collect the weights and biases of every linear layer as arrays.
+
+        :return:
+            A mapping of array names (W0, b0, W1, b1, ...) to arrays
+        """
+        arrays: Dict[AnyStr, np.ndarray] = {}
+
+        for i, row in enumerate(self._linear_layers()):
+            arrays[f"W{i}"] = np.array([[w.data for w in n.weights] for n in row.neurons], dtype=np.float64)
+            arrays[f"b{i}"] = np.array([n.bias.data for n in row.neurons], dtype=np.float64)
+
+        return arrays
+
+    # generate the source code of the forward function
+    def source(self, weights_file: AnyStr = "weights.npz") -> AnyStr:
+        """
+        Generate the source code of the standalone forward function.
+
+        :param weights_file: The weights file name, relative to the generated module
+
+        :return:
+            The python source of the generated module
+        """
+        lines: List[AnyStr] = [_HEADER.format(weights=weights_file)]
+
+        n_linear = len(self._linear_layers())
+        for i in range(n_linear):
+            lines.append(f'W{i} = _arrays["W{i}"]\nb{i} = _arrays["b{i}"]')
+
+        lines.append("\n\ndef forward(x):")
+        lines.append("    x = np.asarray(x, dtype=np.float64)")
+
+        i = 0
+        for row in self.model._sequence:
+            if isinstance(row, Linear):
+                lines.append(f"    x = x @ W{i}.T + b{i}")
+                i += 1
+            elif type(row) in _ACTIVATIONS:
+                lines.append(f"    x = {_ACTIVATIONS[type(row)]}")
+            else:
+                raise TypeError(f"cannot export layer of type {type(row).__name__}")
+
+        # a single output neuron returns a scalar, just like Linear.forward
+        lines.append("    return x[..., 0] if x.shape[-1] == 1 else x\n")
+
+        return "\n".join(lines)
+
+    # write the weights file and the forward module to a directory
+    def export(self, directory: AnyStr, name: AnyStr = "model") -> AnyStr:
+        """
+        Export the module to a weights file and a generated forward module.
+
+        :param directory: The directory to write the artifact to
+        :param name: The base name of the weights file and the forward module
+
+        :return:
+            The path of the generated forward module
+        """
+        os.makedirs(directory, exist_ok=True)
+
+        weights_file = f"{name}.npz"
+        np.savez(os.path.join(directory, weights_file), **self.weights())
+
+        path = os.path.join(directory, f"{name}.py")
+        with open(path, "w") as f:
+            f.write(self.source(weights_file))
+
+        return path
+
+    # return the linear layers of the module
+    def _linear_layers(self) -> List[Linear]:
+        """
+        Return the linear layers of the module, in order.
+
+        :return:
+            The linear layers of the module
+        """
+        return [row for row in self.model._sequence if isinstance(row, Linear)]
@@ -31,7 +31,7 @@ class Module:
     # zero the gradients of the parameters
     def zero_grad(self) -> None:
         """
-        Zero the gradients of the parameters.
+        Zero the gradients of the parameters, and reset the active arena.
 
         :return:
             None
@@ -39,6 +39,10 @@ class Module:
         for p in self.parameters():
             p.grad = 0.0
 
+        # the graph of the previous step is no longer needed
+        if Node._arena is not None:
+            Node._arena.reset()
+
     # update the parameters of the module
     def update(self, lr: Union[float, int]) -> None:
         """
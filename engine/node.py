@@ -3,7 +3,15 @@ import numpy as np
 import random
 
 
+# backward pass of leaf nodes, shared instead of allocating a lambda per node
+def _leaf_backward() -> None:
+    return None
+
+
 class Node:
+    # the arena that nodes created by operations are taken from, see engine.arena
+    _arena = None
+
     def __init__(self, data: Union[int, float], label: AnyStr = "", _children: Tuple = (), _op: AnyStr = "") -> None:
         """
         Initialize a node in the computational graph.
@@ -21,9 +29,33 @@ class Node:
         # private
         self._children = set(_children)
         self._op = _op
-        self._backward = lambda: None
+        self._backward = _leaf_backward
         self._coeff = 1.0
 
+    # create a node, taking it from the active arena if there is one
+    @staticmethod
+    def _new(data: Union[int, float], _children: Tuple = (), _op: AnyStr = "") -> "Node":
+        """
+        Create a node produced by an operation.
+
+        :param data: The data of the node
+        :param _children: The children of the node
+        :param _op: The operation of the node
+        :return: A new node, or a reset node from the active arena
+        """
+        if Node._arena is None:
+            return Node(data, _children=_children, _op=_op)
+
+        out = Node._arena.allocate()
+        out.data = data
+        out.label = ""
+        out.grad = 0.0
+        out._children.update(_children)
+        out._op = _op
+        out._coeff = 1.0
+
+        return out
+
     # node in string format
     def __str__(self) -> AnyStr:
         """
@@ -42,12 +74,14 @@ class Node:
         """
         Add two nodes together.
 
-        :param other: The other node to add
+        :param other: The other node, or a constant, to add
         :return: The sum of the two nodes
         """
-        other = other if isinstance(other, Node) else Node(other)
+        # constants are literals, they never join the graph
+        if not isinstance(other, Node):
+            return self._scalar(self.data + other, 1, '+')
 
-        out = Node(self.data + other.data, _children=(self, other), _op='+')
+        out = Node._new(self.data + other.data, _children=(self, other), _op='+')
 
         def _backward() -> None:
             # consider the numerical coefficient of the variables
@@ -68,12 +102,14 @@ class Node:
         """
         Multiply two nodes.
 
-        :param other: The other node to multiply
+        :param other: The other node, or a constant, to multiply
         :return: The product of the two nodes
         """
-        other = other if isinstance(other, Node) else Node(other)
+        # constants are literals, they never join the graph
+        if not isinstance(other, Node):
+            return self._scalar(self.data * other, other, '*')
 
-        out = Node(self.data * other.data, _children=(self, other), _op='*')
+        out = Node._new(self.data * other.data, _children=(self, other), _op='*')
 
         def _backward() -> None:
             # consider the numerical coefficient of the variables
@@ -89,6 +125,49 @@ class Node:
 
         return out
 
+    # node subtraction
+    def __sub__(self, other) -> "Node":
+        """
+        Subtract two nodes.
+
+        :param other: The other node, or a constant, to subtract
+        :return: The difference of the two nodes
+        """
+        if not isinstance(other, Node):
+            return self + (-other)
+
+        out = Node._new(self.data - other.data, _children=(self, other), _op='-')
+
+        def _backward() -> None:
+            self.grad += out.grad * self._coeff
+            other.grad -= out.grad * other._coeff
+
+        out._backward = _backward
+
+        return out
+
+    # node division
+    def __truediv__(self, other) -> "Node":
+        """
+        Divide two nodes.
+
+        :param other: The other node, or a constant, to divide by
+        :return: The quotient of the two nodes
+        """
+        if not isinstance(other, Node):
+            return self * (1 / other)
+
+        out = Node._new(self.data / other.data, _children=(self, other), _op='/')
+
+        def _backward() -> None:
+            # derivative of a/b is 1/b with respect to a, and -a/b^2 with respect to b
+            self.grad += (out.grad / other.data) * self._coeff
+            other.grad -= (out.grad * self.data / other.data ** 2) * other._coeff
+
+        out._backward = _backward
+
+        return out
+
     # exponentiation
     def __pow__(self, other) -> "Node":
         """
@@ -100,7 +179,7 @@ class Node:
         # only accept int or float
         assert isinstance(other, (int, float))
 
-        out = Node(self.data ** other, _children=(self,), _op=f'**{other}')
+        out = Node._new(self.data ** other, _children=(self,), _op=f'**{other}')
 
         def _backward() -> None:
             # consider the numerical coefficient of the variables
@@ -115,29 +194,61 @@ class Node:
 
         return out
 
+    # negation
+    def __neg__(self) -> "Node":
+        """
+        Negate the node.
+
+        :return: The negated node
+        """
+        return self._scalar(-self.data, -1, 'neg')
+
     # right multiplication
     def __rmul__(self, other):
         return self * other
 
-    # division
-    def __truediv__(self, other):
-        return self * (other ** -1)
-
-    # negation
-    def __neg__(self):
-        return self * -1
-
-    # subtraction
-    def __sub__(self, other):
-        return self + (-other)
-
     # right addition
     def __radd__(self, other):
         return self + other
 
     # right subtraction
-    def __rsub__(self, other):
-        return (-self) + other
+    def __rsub__(self, other) -> "Node":
+        """
+        Subtract the node from a constant.
+
+        :param other: The constant to subtract from
+        :return: The difference of the constant and the node
+        """
+        return self._scalar(other - self.data, -1, f'{other}-')
+
+    # right division
+    def __rtruediv__(self, other) -> "Node":
+        """
+        Divide a constant by the node.
+
+        :param other: The constant to divide
+        :return: The quotient of the constant and the node
+        """
+        return self._scalar(other / self.data, -other / self.data ** 2, f'{other}/')
+
+    # an operation whose only input is the node, with a constant derivative
+    def _scalar(self, data: Union[int, float], derivative: Union[int, float], op: AnyStr) -> "Node":
+        """
+        Create the output of an operation between the node and a constant.
+
+        :param data: The data of the output
+        :param derivative: The derivative of the output with respect to the node
+        :param op: The operation of the output
+        :return: The output node
+        """
+        out = Node._new(data, _children=(self,), _op=op)
+
+        def _backward() -> None:
+            self.grad += (derivative * out.grad) * self._coeff
+
+        out._backward = _backward
+
+        return out
 
     # tanh activation function
     def tanh(self) -> "Node":
@@ -146,7 +257,7 @@ class Node:
 
         :return: The node with the tanh activation function applied
         """
-        out = Node(np.tanh(self.data), _children=(self,), _op='tanh')
+        out = Node._new(np.tanh(self.data), _children=(self,), _op='tanh')
 
         def _backward() -> None:
             # derivative of tanh is 1 - tanh^2
@@ -163,7 +274,7 @@ class Node:
 
         :return: The node with the relu activation function applied
         """
-        out = Node(np.maximum(0, self.data), _children=(self,), _op='relu')
+        out = Node._new(np.maximum(0, self.data), _children=(self,), _op='relu')
 
         def _backward() -> None:
             # derivative of relu is 1 if x > 0 else 0
@@ -180,8 +291,8 @@ class Node:
 
         :return: The node with the gelu activation function applied
         """
-        out = Node(0.5 * self.data * (1 + np.tanh(np.sqrt(2 / np.pi) * (self.data + 0.044715 * self.data ** 3))),
-                   _children=(self,), _op='gelu')
+        out = Node._new(0.5 * self.data * (1 + np.tanh(np.sqrt(2 / np.pi) * (self.data + 0.044715 * self.data ** 3))),
+                        _children=(self,), _op='gelu')
 
         def _backward() -> None:
             # derivative of gelu is very long since product rule is applied
@@ -200,7 +311,7 @@ class Node:
 
         :return: The node raised to the power of e
         """
-        out = Node(np.exp(self.data), _children=(self,), _op=f'exp')
+        out = Node._new(np.exp(self.data), _children=(self,), _op=f'exp')
 
         def _backward() -> None:
             self.grad += out.data * out.grad
@@ -216,7 +327,7 @@ class Node:
 
         :return: The node with the log function applied
         """
-        out = Node(np.log(self.data), _children=(self,), _op='log')
+        out = Node._new(np.log(self.data), _children=(self,), _op='log')
 
         def _backward() -> None:
             self.grad += (1 / self.data) * out.grad
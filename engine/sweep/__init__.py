@@ -0,0 +1 @@
+from .sweep import Sweep, Trial, mlp
@@ -0,0 +1,239 @@
+from typing import List, Union, Any, Dict, Callable, Optional, AnyStr
+from concurrent.futures import ProcessPoolExecutor
+from engine.nn.module import Module
+from engine.nn.linear import Linear
+from engine.nn.activation import ReLU, Tanh, GeLU
+from engine.train import Trainer
+import itertools
+import random
+import math
+
+
+_Data = List[List[Union[int, float]]]
+_Labels = List[Union[List[Union[int, float]], int, float]]
+
+# activation functions that can be selected by name in a search space
+_ACTIVATIONS: Dict[AnyStr, type] = {
+    "relu": ReLU,
+    "tanh": Tanh,
+    "gelu": GeLU,
+}
+
+
+# build a multilayer perceptron from a configuration
+def mlp(features: int, outputs: int, config: Dict[AnyStr, Any]) -> Module:
+    """
+    Build a multilayer perceptron from a configuration.
+
+    :param features: The number of input features
+    :param outputs: The number of outputs
+    :param config: The configuration, using the "widths" and "activation" keys
+
+    :return:
+        The module described by the configuration
+    """
+    activation = _ACTIVATIONS[config.get("activation", "relu")]
+
+    sequence: List[Any] = []
+    for width in config.get("widths", []):
+        sequence.extend([Linear(features, width), activation()])
+        features = width
+
+    sequence.append(Linear(features, outputs))
+
+    return Module(sequence)
+
+
+# train a single trial, meant to run in a worker process
+def _run_trial(builder: Callable, features: int, outputs: int, config: Dict[AnyStr, Any], seed: int,
+               weights: Optional[List[float]], epochs: int, train: tuple, val: tuple) -> tuple:
+    """
+    Train a trial for a number of epochs and evaluate it on the validation data.
+
+    :param builder: Builds the module from (features, outputs, config)
+    :param features: The number of input features
+    :param outputs: The number of outputs
+    :param config: The configuration of the trial
+    :param seed: The seed of the trial
+    :param weights: The weights to resume from, or None to start from scratch
+    :param epochs: The number of epochs to train for
+    :param train: The train data and labels
+    :param val: The validation data and labels
+
+    :return:
+        The trained weights and the validation loss
+    """
+    # isolate the randomness of every trial
+    random.seed(seed)
+    model = builder(features, outputs, config)
+    trainer = Trainer(model, lr=config.get("lr", 0.01))
+
+    if weights is not None:
+        for p, w in zip(model.parameters(), weights):
+            p.data = w
+
+    trainer.fit(*train, epochs)
+    loss = trainer.evaluate(*val)
+
+    return [p.data for p in model.parameters()], loss
+
+
+class Trial:
+    def __init__(self, config: Dict[AnyStr, Any], seed: int) -> None:
+        """
+        Initialize a trial of the sweep.
+
+        :param config: The configuration of the trial
+        :param seed: The seed of the trial
+        """
+        self.config = config
+        self.seed = seed
+        self.epochs = 0
+        self.val_loss = math.inf
+        self.weights: Optional[List[float]] = None
+
+    # string representation of the trial
+    def __str__(self) -> str:
+        """
+        Return the string representation of the trial.
+
+        :return:
+            The string representation of the trial
+        """
+        return f"Trial(config={self.config}, seed={self.seed}, epochs={self.epochs}, val_loss={self.val_loss})"
+
+    # string representation of the trial
+    def __repr__(self) -> str:
+        """
+        Return the string representation of the trial.
+
+        :return:
+            The string representation of the trial
+        """
+        return self.__str__()
+
+
+class Sweep:
+    def __init__(self, space: Dict[AnyStr, Any], mode: AnyStr = "grid", trials: int = 10, seed: int = 0,
+                 workers: Optional[int] = None, eta: Optional[int] = 3, min_epochs: int = 1,
+                 builder: Callable = mlp) -> None:
+        """
+        Initialize a hyperparameter sweep.
+
+        The space maps configuration keys (e.g. "lr", "epochs", "widths", "activation") to the
+        values to try. In grid mode every value is a list of choices. In random mode a list is
+        sampled uniformly and a (low, high) tuple is sampled from a uniform distribution, or
+        from the integers between low and high (inclusive) when both bounds are ints.
+
+        :param space: The search space
+        :param mode: Either "grid" or "random"
+        :param trials: The number of configurations to sample in random mode
+        :param seed: The base seed, every trial gets its own seed derived from it
+        :param workers: The number of worker processes, 1 trains in the current process
+        :param eta: The successive halving rate, None trains every trial for its full epochs
+        :param min_epochs: The epochs of the first successive halving rung
+        :param builder: Builds the module from (features, outputs, config), must be picklable
+        """
+        assert mode in ("grid", "random")
+        assert eta is None or eta >= 2
+
+        self.space = space
+        self.mode = mode
+        self.trials = trials
+        self.seed = seed
+        self.workers = workers
+        self.eta = eta
+        self.min_epochs = min_epochs
+        self.builder = builder
+
+    # generate the configurations of the sweep
+    def configs(self) -> List[Dict[AnyStr, Any]]:
+        """
+        Generate the configurations of the sweep.
+
+        :return:
+            The configurations to train
+        """
+        if self.mode == "grid":
+            keys = list(self.space)
+            return [dict(zip(keys, values)) for values in itertools.product(*(self.space[k] for k in keys))]
+
+        rng = random.Random(self.seed)
+        configs: List[Dict[AnyStr, Any]] = []
+        for _ in range(self.trials):
+            config: Dict[AnyStr, Any] = {}
+            for key, values in self.space.items():
+                if isinstance(values, tuple) and all(isinstance(v, int) for v in values):
+                    config[key] = rng.randint(*values)
+                elif isinstance(values, tuple):
+                    config[key] = rng.uniform(*values)
+                else:
+                    config[key] = rng.choice(values)
+            configs.append(config)
+
+        return configs
+
+    # run the sweep
+    def run(self, train_data: _Data, train_labels: _Labels, val_data: _Data, val_labels: _Labels,
+            epochs: int = 100) -> List[Trial]:
+        """
+        Train every configuration and rank them by validation loss.
+
+        With successive halving, every rung trains the surviving trials up to the rung's epochs,
+        then keeps the best 1/eta of them. The epochs of a rung grow by a factor of eta, and are
+        capped by the "epochs" key of the configuration, or by the epochs argument.
+
+        :param train_data: The train data
+        :param train_labels: The train labels
+        :param val_data: The validation data
+        :param val_labels: The validation labels
+        :param epochs: The epochs of configurations without an "epochs" key
+
+        :return:
+            The trials, best first. Trials that finished their epochs rank by validation loss,
+            before the trials stopped early, which rank by the rung they reached and report the
+            loss of that rung
+        """
+        features = len(train_data[0])
+        outputs = len(train_labels[0]) if isinstance(train_labels[0], list) else 1
+        train, val = (train_data, train_labels), (val_data, val_labels)
+
+        trials = [Trial(config, self.seed + i) for i, config in enumerate(self.configs())]
+
+        executor = ProcessPoolExecutor(self.workers) if self.workers != 1 else None
+        try:
+            alive, budget = trials, self.min_epochs
+            while alive:
+                # without successive halving, train every trial for its full epochs at once
+                targets = [t.config.get("epochs", epochs) for t in alive]
+                if self.eta is not None:
+                    targets = [min(budget, target) for target in targets]
+
+                tasks = [(self.builder, features, outputs, t.config, t.seed, t.weights,
+                          target - t.epochs, train, val) for t, target in zip(alive, targets)]
+
+                if executor is None:
+                    results = [_run_trial(*task) for task in tasks]
+                else:
+                    results = list(executor.map(_run_trial, *zip(*tasks)))
+
+                for t, target, (weights, loss) in zip(alive, targets, results):
+                    t.weights, t.val_loss, t.epochs = weights, loss, target
+
+                # trials that reached their epochs are done, the rest compete for the next rung
+                alive = [t for t in alive if t.epochs < t.config.get("epochs", epochs)]
+
+                if self.eta is not None:
+                    alive = sorted(alive, key=lambda t: t.val_loss)[:max(len(alive) // self.eta, 1)]
+                    budget *= self.eta
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        # a stopped trial was only trained up to its rung, its budget being below its epochs
+        def rank(t: Trial) -> tuple:
+            if t.epochs >= t.config.get("epochs", epochs):
+                return 0, 0, t.val_loss
+            return 1, -t.epochs, t.val_loss
+
+        return sorted(trials, key=rank)
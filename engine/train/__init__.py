@@ -0,0 +1,3 @@
+from .schedule import StepLR, CosineLR, WarmupLR
+from .callback import Checkpoint
+from .trainer import Trainer
@@ -0,0 +1,63 @@
+from typing import Dict, Any, AnyStr
+from engine.nn.module import Module
+import numpy as np
+import os
+
+
+class Checkpoint:
+    def __init__(self, path: AnyStr, every: int = 1) -> None:
+        """
+        Save the parameters of the module every few epochs.
+
+        :param path: The checkpoint file, formatted with the epoch (e.g. "ckpt/epoch{epoch}.npy")
+        :param every: The number of epochs between checkpoints
+        """
+        self.path = path
+        self.every = every
+
+    # save a checkpoint at the end of an epoch
+    def __call__(self, trainer: Any, logs: Dict[AnyStr, Any]) -> None:
+        """
+        Save a checkpoint if the epoch is a multiple of every.
+
+        :param trainer: The trainer calling the callback
+        :param logs: The logs of the epoch
+
+        :return:
+            None
+        """
+        if (logs["epoch"] + 1) % self.every == 0:
+            self.save(trainer.model, self.path.format(epoch=logs["epoch"]))
+
+    # save the parameters of a module
+    @staticmethod
+    def save(model: Module, path: AnyStr) -> None:
+        """
+        Save the parameters of a module.
+
+        :param model: The module to save
+        :param path: The file to save to
+
+        :return:
+            None
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        np.save(path, np.array([p.data for p in model.parameters()], dtype=np.float64))
+
+    # load the parameters of a module
+    @staticmethod
+    def load(model: Module, path: AnyStr) -> None:
+        """
+        Load the parameters of a module.
+
+        :param model: The module to load into
+        :param path: The file to load from
+
+        :return:
+            None
+        """
+        for p, data in zip(model.parameters(), np.load(path)):
+            p.data = float(data)
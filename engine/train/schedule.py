@@ -0,0 +1,159 @@
+from typing import Union, Callable
+import math
+
+
+_Schedule = Union[Callable[[int], float], int, float]
+
+
+class StepLR:
+    def __init__(self, lr: Union[float, int], step_size: int, gamma: float = 0.1) -> None:
+        """
+        Decay the learning rate by gamma every step_size epochs.
+
+        :param lr: The initial learning rate
+        :param step_size: The number of epochs between decays
+        :param gamma: The decay factor
+        """
+        self.lr = lr
+        self.step_size = step_size
+        self.gamma = gamma
+
+    # the learning rate of an epoch
+    def __call__(self, epoch: int) -> float:
+        """
+        Return the learning rate of an epoch.
+
+        :param epoch: The epoch, starting at 0
+
+        :return:
+            The learning rate of the epoch
+        """
+        return self.lr * self.gamma ** (epoch // self.step_size)
+
+    # string representation of the schedule
+    def __str__(self) -> str:
+        """
+        Return the string representation of the schedule.
+
+        :return:
+            The string representation of the schedule
+        """
+        return f"StepLR(lr={self.lr}, step_size={self.step_size}, gamma={self.gamma})"
+
+    # string representation of the schedule
+    def __repr__(self) -> str:
+        """
+        Return the string representation of the schedule.
+
+        :return:
+            The string representation of the schedule
+        """
+        return self.__str__()
+
+
+class CosineLR:
+    def __init__(self, lr: Union[float, int], epochs: int, min_lr: float = 0.0) -> None:
+        """
+        Anneal the learning rate from lr to min_lr along a cosine curve.
+
+        :param lr: The initial learning rate
+        :param epochs: The number of epochs to anneal over
+        :param min_lr: The final learning rate
+        """
+        self.lr = lr
+        self.epochs = epochs
+        self.min_lr = min_lr
+
+    # the learning rate of an epoch
+    def __call__(self, epoch: int) -> float:
+        """
+        Return the learning rate of an epoch.
+
+        :param epoch: The epoch, starting at 0
+
+        :return:
+            The learning rate of the epoch
+        """
+        progress = min(epoch, self.epochs) / max(self.epochs, 1)
+        return self.min_lr + 0.5 * (self.lr - self.min_lr) * (1 + math.cos(math.pi * progress))
+
+    # string representation of the schedule
+    def __str__(self) -> str:
+        """
+        Return the string representation of the schedule.
+
+        :return:
+            The string representation of the schedule
+        """
+        return f"CosineLR(lr={self.lr}, epochs={self.epochs}, min_lr={self.min_lr})"
+
+    # string representation of the schedule
+    def __repr__(self) -> str:
+        """
+        Return the string representation of the schedule.
+
+        :return:
+            The string representation of the schedule
+        """
+        return self.__str__()
+
+
+class WarmupLR:
+    def __init__(self, schedule: _Schedule, warmup_epochs: int) -> None:
+        """
+        Linearly warm the learning rate up, then follow another schedule.
+
+        :param schedule: The learning rate or schedule to follow after the warmup
+        :param warmup_epochs: The number of warmup epochs
+        """
+        self.schedule = schedule
+        self.warmup_epochs = warmup_epochs
+
+    # the learning rate of an epoch
+    def __call__(self, epoch: int) -> float:
+        """
+        Return the learning rate of an epoch.
+
+        :param epoch: The epoch, starting at 0
+
+        :return:
+            The learning rate of the epoch
+        """
+        if epoch < self.warmup_epochs:
+            return _lr(self.schedule, 0) * (epoch + 1) / self.warmup_epochs
+
+        return _lr(self.schedule, epoch - self.warmup_epochs)
+
+    # string representation of the schedule
+    def __str__(self) -> str:
+        """
+        Return the string representation of the schedule.
+
+        :return:
+            The string representation of the schedule
+        """
+        return f"WarmupLR(schedule={self.schedule}, warmup_epochs={self.warmup_epochs})"
+
+    # string representation of the schedule
+    def __repr__(self) -> str:
+        """
+        Return the string representation of the schedule.
+
+        :return:
+            The string representation of the schedule
+        """
+        return self.__str__()
+
+
+# the learning rate of an epoch for a constant or a schedule
+def _lr(schedule: _Schedule, epoch: int) -> float:
+    """
+    Return the learning rate of an epoch.
+
+    :param schedule: A constant learning rate or a schedule
+    :param epoch: The epoch, starting at 0
+
+    :return:
+        The learning rate of the epoch
+    """
+    return schedule(epoch) if callable(schedule) else schedule
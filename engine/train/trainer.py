@@ -0,0 +1,161 @@
+from typing import List, Union, Any, Dict, Callable, Optional, AnyStr, Iterable
+from engine.nn.module import Module
+from engine.loss import MSELoss
+from engine.train.schedule import _Schedule, _lr
+import math
+
+
+_Data = List[List[Union[int, float]]]
+_Labels = List[Union[List[Union[int, float]], int, float]]
+
+
+class Trainer:
+    def __init__(self, model: Module, criterion: Any = None, lr: _Schedule = 0.01, accumulate: int = 1,
+                 patience: Optional[int] = None, min_delta: float = 0.0, restore_best: bool = True,
+                 callbacks: Iterable[Callable] = ()) -> None:
+        """
+        Initialize the trainer.
+
+        :param model: The module to train
+        :param criterion: The loss function, MSELoss by default
+        :param lr: A constant learning rate, or a schedule mapping the epoch to a learning rate
+        :param accumulate: The number of samples whose gradients are averaged into one update
+        :param patience: The epochs without validation improvement before stopping, None never stops early
+        :param min_delta: The smallest decrease of the validation loss that counts as an improvement
+        :param restore_best: Whether to restore the parameters of the best validation epoch after training
+        :param callbacks: Called with (trainer, logs) at the end of every epoch
+        """
+        assert accumulate >= 1
+
+        self.model = model
+        self.criterion = criterion if criterion is not None else MSELoss()
+        self.lr = lr
+        self.accumulate = accumulate
+        self.patience = patience
+        self.min_delta = min_delta
+        self.restore_best = restore_best
+        self.callbacks = list(callbacks)
+        self.history: List[Dict[AnyStr, Any]] = []
+
+    # train the module for one epoch
+    def train_epoch(self, data: _Data, labels: _Labels, lr: Union[float, int]) -> float:
+        """
+        Train the module for one epoch.
+
+        The gradients of every accumulate samples are summed, then applied as their mean.
+
+        :param data: The train data
+        :param labels: The train labels
+        :param lr: The learning rate of the epoch
+
+        :return:
+            The mean train loss of the epoch
+        """
+        total, pending = 0.0, 0
+
+        self.model.zero_grad()
+        for x, y in zip(data, labels):
+            self.criterion(y, self.model(x))
+            self.criterion.backward()
+            total += float(self.criterion.loss.data)
+            pending += 1
+
+            if pending == self.accumulate:
+                self._step(lr, pending)
+                pending = 0
+
+        # apply the gradients of a last, partial accumulation
+        if pending:
+            self._step(lr, pending)
+
+        return total / max(len(data), 1)
+
+    # evaluate the module
+    def evaluate(self, data: _Data, labels: _Labels) -> float:
+        """
+        Evaluate the module without updating it.
+
+        :param data: The data
+        :param labels: The labels
+
+        :return:
+            The mean loss over the data
+        """
+        total = 0.0
+        for x, y in zip(data, labels):
+            self.criterion(y, self.model(x))
+            total += float(self.criterion.loss.data)
+
+        loss = total / max(len(data), 1)
+
+        # diverged modules lose every comparison
+        return loss if math.isfinite(loss) else math.inf
+
+    # train the module
+    def fit(self, train_data: _Data, train_labels: _Labels, epochs: int, val_data: Optional[_Data] = None,
+            val_labels: Optional[_Labels] = None, verbose: bool = False) -> List[Dict[AnyStr, Any]]:
+        """
+        Train the module, stopping early when the validation loss stops improving.
+
+        Every call starts a new run: the history and the learning rate schedule restart at epoch 0.
+
+        :param train_data: The train data
+        :param train_labels: The train labels
+        :param epochs: The maximum number of epochs
+        :param val_data: The validation data
+        :param val_labels: The validation labels
+        :param verbose: Whether to print the logs of every epoch
+
+        :return:
+            The logs of every epoch
+        """
+        self.history = []
+        best, best_params, waited = math.inf, None, 0
+
+        for epoch in range(epochs):
+            lr = _lr(self.lr, epoch)
+            logs: Dict[AnyStr, Any] = {"epoch": epoch, "lr": lr,
+                                       "train_loss": self.train_epoch(train_data, train_labels, lr)}
+
+            if val_data is not None:
+                logs["val_loss"] = self.evaluate(val_data, val_labels)
+
+            self.history.append(logs)
+
+            if verbose:
+                print(", ".join(f"{k}: {v}" for k, v in logs.items()))
+
+            for callback in self.callbacks:
+                callback(self, logs)
+
+            if val_data is None:
+                continue
+
+            if logs["val_loss"] < best - self.min_delta:
+                best, waited = logs["val_loss"], 0
+                best_params = [p.data for p in self.model.parameters()]
+            else:
+                waited += 1
+
+            if self.patience is not None and waited >= self.patience:
+                break
+
+        if self.restore_best and best_params is not None:
+            for p, data in zip(self.model.parameters(), best_params):
+                p.data = data
+
+        return self.history
+
+    # apply the mean of the accumulated gradients
+    def _step(self, lr: Union[float, int], samples: int) -> None:
+        """
+        Apply the mean of the accumulated gradients, then zero them.
+
+        :param lr: The learning rate
+        :param samples: The number of samples the gradients were accumulated over
+
+        :return:
+            None
+        """
+        self.model.update(lr / samples)
+        self.model.zero_grad()
@@ -1,7 +1,9 @@
+import random
 from engine.nn.module import Module
 from engine.nn.linear import Linear
 from engine.nn.activation import ReLU
 from engine.loss import MSELoss
+from engine.train import Trainer
 
 
 class MLPModel(Module):
@@ -19,9 +21,12 @@ class MLPModel(Module):
 # execute the code
 if __name__ == "__main__":
     ## Model, Criterion, and Hyperparameters
+    # the inputs are not normalized (50-90 kg), so the learning rate has to be tiny,
+    # and the seed picks an initialization whose final ReLU is not already dead
+    random.seed(0)
     model = MLPModel()
     criterion = MSELoss()
-    lr = 0.1
+    lr = 1e-7
     epochs = 100
 
     ## Train data and corresponding labels
@@ -45,18 +50,9 @@ if __name__ == "__main__":
     ##
     ## Train the network
     ##
-    for epoch in range(epochs):
-        for x, y in zip(train_data, train_labels):
-            model.zero_grad()
-
-            y_pred = model(x)
-
-            criterion(y, y_pred)
-            criterion.backward()
-
-        model.update(lr)
-
-        print(f"Epoch {epoch}, Loss: {criterion}")
+    # accumulate the gradients of every sample into one update per epoch
+    trainer = Trainer(model, criterion, lr=lr, accumulate=len(train_data))
+    trainer.fit(train_data, train_labels, epochs, verbose=True)
 
     ##
     ## Test the network
@@ -0,0 +1,71 @@
+import unittest
+from engine.node import Node
+from engine.arena import Arena
+from engine.loss import MSELoss
+from testing.fixtures import model, train_data, train_labels
+
+
+# run a few training steps, returning the gradients of every step
+def train(m):
+    criterion, grads = MSELoss(), []
+    for x, y in zip(train_data, train_labels):
+        m.zero_grad()
+        criterion(y, m(x))
+        criterion.backward()
+        grads.append([p.grad for p in m.parameters()])
+        m.update(0.1)
+    return grads
+
+
+class ArenaTestCase(unittest.TestCase):
+    def test_same_gradients(self):
+        expected = train(model())
+
+        with Arena():
+            self.assertEqual(train(model()), expected)
+
+    def test_reuses_nodes(self):
+        m = model()
+
+        with Arena() as arena:
+            train(m)
+            used, capacity = len(arena), len(arena._pool)
+
+            # every step builds the same graph, so the pool stops growing
+            train(m)
+            self.assertEqual(len(arena), used)
+            self.assertEqual(len(arena._pool), capacity)
+
+            m.zero_grad()
+            self.assertEqual(len(arena), 0)
+
+    def test_exit_releases_nodes(self):
+        m = model()
+
+        with Arena() as arena:
+            out = m(train_data[0])
+            self.assertGreater(len(arena), 0)
+
+            # inference never calls zero_grad, the caller resets the arena
+            arena.reset()
+            self.assertEqual(len(arena), 0)
+
+            out = m(train_data[0])
+
+        self.assertEqual(len(arena), 0)
+        self.assertEqual(out._children, set())
+
+    def test_enter_exit(self):
+        outer, inner = Arena(), Arena(capacity=4)
+
+        with outer:
+            with inner:
+                self.assertIs(Node._arena, inner)
+                self.assertIs((Node(1.0) + 2), inner._pool[0])
+            self.assertIs(Node._arena, outer)
+
+        self.assertIsNone(Node._arena)
+
+
+if __name__ == '__main__':
+    unittest.main()
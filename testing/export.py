@@ -0,0 +1,54 @@
+import importlib.util
+import tempfile
+import unittest
+import numpy as np
+from engine.nn.module import Module
+from engine.nn.linear import Linear
+from engine.nn.activation import ReLU, Tanh, GeLU
+from engine.export import NumpyExporter
+
+
+# load a generated forward module from its path
+def load(path):
+    spec = importlib.util.spec_from_file_location("exported", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class NumpyExporterTestCase(unittest.TestCase):
+    def test_export_matches_forward(self):
+        model = Module([Linear(3, 8), ReLU(), Linear(8, 4), Tanh(), Linear(4, 1), GeLU()])
+        data = [[1.70, 0.7, 1], [-1.60, 0.5, 0], [0.2, -0.8, 1]]
+
+        with tempfile.TemporaryDirectory() as directory:
+            exported = load(NumpyExporter(model).export(directory))
+
+            # the weights file is closed once the arrays are loaded
+            self.assertIsNone(exported._weights.fid)
+
+            for x in data:
+                self.assertAlmostEqual(float(exported.forward(x)), float(model(x).data))
+
+            # batched inputs give one output per row
+            expected = [model(x).data for x in data]
+            np.testing.assert_allclose(exported.forward(data), expected)
+
+    def test_export_multiple_outputs(self):
+        model = Module([Linear(2, 3), ReLU()])
+
+        with tempfile.TemporaryDirectory() as directory:
+            exported = load(NumpyExporter(model).export(directory, name="mlp"))
+
+            x = [0.3, -0.4]
+            np.testing.assert_allclose(exported.forward(x), [n.data for n in model(x)])
+
+    def test_export_unknown_layer(self):
+        model = Module([Linear(2, 2), object()])
+
+        with self.assertRaises(TypeError):
+            NumpyExporter(model).source()
+
+
+if __name__ == '__main__':
+    unittest.main()
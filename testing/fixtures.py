@@ -0,0 +1,17 @@
+import random
+from engine.nn.module import Module
+from engine.nn.linear import Linear
+from engine.nn.activation import Tanh
+
+
+# a small regression problem shared by the test cases
+train_data = [[0.1, 0.2], [0.4, 0.1], [0.9, 0.5], [0.3, 0.8], [0.6, 0.6], [0.2, 0.4]]
+train_labels = [0.3, 0.5, 1.4, 1.1, 1.2, 0.6]
+val_data = [[0.5, 0.3], [0.7, 0.2]]
+val_labels = [0.8, 0.9]
+
+
+# build a small module with a fixed seed
+def model(seed=0):
+    random.seed(seed)
+    return Module([Linear(2, 4), Tanh(), Linear(4, 1)])
@@ -29,6 +29,44 @@ class NodeTestCase(unittest.TestCase):
 
         self.assertEqual(o.grad, 1.0)
 
+    def test_scalar_ops(self):
+        ops = [
+            lambda a, b: a - b,
+            lambda a, b: a / b,
+            lambda a, b: -a * b,
+            lambda a, b: 2 - a + b,
+            lambda a, b: 3 / a - b / 2,
+            lambda a, b: (a - 1) ** 2 / (b + 4),
+        ]
+
+        for op in ops:
+            a, b = Node(1.5), Node(-0.5)
+            out = op(a, b)
+            out.backward()
+
+            # compare with the central difference of the same expression on floats
+            eps = 1e-6
+            self.assertAlmostEqual(a.grad, (op(1.5 + eps, -0.5) - op(1.5 - eps, -0.5)) / (2 * eps), places=5)
+            self.assertAlmostEqual(b.grad, (op(1.5, -0.5 + eps) - op(1.5, -0.5 - eps)) / (2 * eps), places=5)
+
+    def test_constants_stay_out_of_the_graph(self):
+        a = Node(3.0)
+        out = (a - 2) ** 2
+
+        # a - 2 and the square, without nodes for 2 or -1
+        self.assertEqual(len(out._children), 1)
+        self.assertEqual(next(iter(out._children))._children, {a})
+
+    def test_constant_ops_return_new_nodes(self):
+        p = Node(2.0)
+        (p * 3).backward()
+
+        # sum starts from 0, its output must not alias p and reset its gradient
+        total = sum([p])
+        self.assertIsNot(total, p)
+        total.backward()
+        self.assertEqual(p.grad, 4.0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+from engine.nn.module import Module
+from engine.nn.linear import Linear
+from engine.sweep import Sweep, mlp
+from testing.fixtures import train_data, train_labels, val_data, val_labels
+
+
+# a single neuron starting from zero, so training is deterministic
+def neuron(features, outputs, config):
+    model = Module([Linear(features, outputs)])
+    for p in model.parameters():
+        p.data = 0.0
+    return model
+
+
+class SweepTestCase(unittest.TestCase):
+    def test_grid_configs(self):
+        sweep = Sweep({"lr": [0.1, 0.01], "widths": [[4], [4, 4]], "activation": ["relu"]})
+
+        self.assertEqual(len(sweep.configs()), 4)
+
+    def test_random_configs(self):
+        space = {"lr": (0.001, 0.1), "epochs": (2, 5), "activation": ["relu", "tanh"]}
+        configs = Sweep(space, mode="random", trials=5, seed=1).configs()
+
+        self.assertEqual(len(configs), 5)
+        self.assertEqual(configs, Sweep(space, mode="random", trials=5, seed=1).configs())
+        self.assertTrue(all(0.001 <= c["lr"] <= 0.1 for c in configs))
+        self.assertTrue(all(isinstance(c["epochs"], int) and 2 <= c["epochs"] <= 5 for c in configs))
+
+        trials = Sweep(space, mode="random", trials=2, workers=1, eta=None).run(train_data, train_labels, val_data, val_labels)
+        self.assertTrue(all(t.epochs == t.config["epochs"] for t in trials))
+
+    def test_successive_halving(self):
+        space = {"lr": [0.05, 0.01, 0.001], "widths": [[4], [8]], "epochs": [9]}
+        trials = Sweep(space, workers=1, eta=3).run(train_data, train_labels, val_data, val_labels)
+
+        self.assertEqual(len(trials), 6)
+        self.assertEqual([t.epochs for t in trials], [9, 3, 1, 1, 1, 1])
+        self.assertEqual([t.val_loss for t in trials[2:]], sorted(t.val_loss for t in trials[2:]))
+
+    def test_survivor_ranks_first(self):
+        # the output moves from 0 towards the train label 2, passing the validation label 1 after one
+        # epoch at lr 0.125, so the survivor of the first rung gets worse at the second one
+        space = {"lr": [0.1, 0.125], "epochs": [2]}
+        sweep = Sweep(space, workers=1, eta=2, builder=neuron)
+        trials = sweep.run([[1.0]], [2.0], [[1.0]], [1.0])
+
+        self.assertEqual([t.config["lr"] for t in trials], [0.125, 0.1])
+        self.assertEqual([t.epochs for t in trials], [2, 1])
+        self.assertGreater(trials[0].val_loss, trials[1].val_loss)
+
+    def test_finished_trials_rank_by_loss(self):
+        # the output moves from 0 towards the label 1, by half the remaining distance every epoch at
+        # lr 0.125, so the trial with fewer epochs is worse, and the one with a lr of 0 never moves
+        space = {"lr": [0.0, 0.125], "epochs": [1, 3]}
+        trials = Sweep(space, workers=1, eta=None, builder=neuron).run([[1.0]], [1.0], [[1.0]], [1.0])
+
+        self.assertEqual([(t.config["lr"], t.epochs) for t in trials], [(0.125, 3), (0.125, 1), (0.0, 1), (0.0, 3)])
+
+        # with halving, the finished 1-epoch trials rank before the 4-epoch trials stopped at a rung,
+        # even the one stopped at the second rung with a better loss
+        space = {"lr": [0.125, 0.1, 0.05, 0.0], "epochs": [1, 4]}
+        trials = Sweep(space, workers=1, eta=2, builder=neuron).run([[1.0]], [1.0], [[1.0]], [1.0])
+
+        self.assertEqual([(t.config["lr"], t.config["epochs"], t.epochs) for t in trials], [
+            (0.125, 4, 4), (0.125, 1, 1), (0.1, 1, 1), (0.05, 1, 1), (0.0, 1, 1),
+            (0.1, 4, 2), (0.05, 4, 1), (0.0, 4, 1),
+        ])
+        self.assertLess(trials[5].val_loss, trials[1].val_loss)
+
+    def test_isolated_seeds(self):
+        space = {"lr": [0.05], "widths": [[4]], "activation": ["tanh"], "epochs": [2]}
+        inline = Sweep(space, workers=1, eta=None).run(train_data, train_labels, val_data, val_labels)
+        pooled = Sweep(space, workers=2, eta=None).run(train_data, train_labels, val_data, val_labels)
+
+        self.assertAlmostEqual(inline[0].val_loss, pooled[0].val_loss)
+
+    def test_mlp(self):
+        model = mlp(2, 1, {"widths": [3], "activation": "gelu"})
+
+        self.assertEqual(len(model.parameters()), 3 * 3 + 1 * 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
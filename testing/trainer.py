@@ -0,0 +1,91 @@
+import os
+import tempfile
+import unittest
+from engine.loss import MSELoss
+from engine.train import Trainer, StepLR, CosineLR, WarmupLR, Checkpoint
+from testing.fixtures import model, train_data, train_labels, val_data, val_labels
+
+
+class TrainerTestCase(unittest.TestCase):
+    def test_gradient_accumulation(self):
+        lr = 0.1
+
+        # update once with the mean gradient of every sample by hand
+        expected, criterion = model(), MSELoss()
+        expected.zero_grad()
+        for x, y in zip(train_data, train_labels):
+            criterion(y, expected(x))
+            criterion.backward()
+        expected.update(lr / len(train_data))
+
+        trained = model()
+        Trainer(trained, lr=lr, accumulate=len(train_data)).fit(train_data, train_labels, 1)
+
+        for p, q in zip(expected.parameters(), trained.parameters()):
+            self.assertAlmostEqual(p.data, q.data)
+
+    def test_partial_accumulation(self):
+        trained = model()
+        before = [p.data for p in trained.parameters()]
+
+        # 6 samples in groups of 4 give one full and one partial update
+        Trainer(trained, lr=0.1, accumulate=4).fit(train_data, train_labels, 1)
+
+        self.assertNotEqual(before, [p.data for p in trained.parameters()])
+
+    def test_loss_decreases(self):
+        history = Trainer(model(), lr=0.1).fit(train_data, train_labels, 20)
+
+        self.assertLess(history[-1]["train_loss"], history[0]["train_loss"])
+
+    def test_schedules(self):
+        self.assertEqual([StepLR(1.0, 2, 0.5)(e) for e in range(5)], [1.0, 1.0, 0.5, 0.5, 0.25])
+        self.assertAlmostEqual(CosineLR(1.0, 10)(0), 1.0)
+        self.assertAlmostEqual(CosineLR(1.0, 10)(5), 0.5)
+        self.assertAlmostEqual(CosineLR(1.0, 10, min_lr=0.1)(10), 0.1)
+        self.assertEqual([WarmupLR(StepLR(1.0, 2, 0.5), 2)(e) for e in range(5)], [0.5, 1.0, 1.0, 1.0, 0.5])
+
+        history = Trainer(model(), lr=StepLR(0.1, 1, 0.5)).fit(train_data, train_labels, 3)
+        self.assertEqual([logs["lr"] for logs in history], [0.1, 0.05, 0.025])
+
+    def test_early_stopping(self):
+        # a learning rate of 0 never improves the validation loss
+        trainer = Trainer(model(), lr=0.0, patience=3)
+        history = trainer.fit(train_data, train_labels, 50, train_data, train_labels)
+
+        self.assertEqual(len(history), 4)
+
+    def test_restores_best_without_stopping(self):
+        # the learning rate grows a thousandfold every epoch, so training diverges
+        trainer = Trainer(model(), lr=StepLR(0.1, 1, 1000.0))
+        history = trainer.fit(train_data, train_labels, 4, val_data, val_labels)
+
+        best = min(logs["val_loss"] for logs in history)
+        self.assertLess(best, history[-1]["val_loss"])
+        self.assertAlmostEqual(trainer.evaluate(val_data, val_labels), best)
+
+    def test_fit_restarts(self):
+        trainer = Trainer(model(), lr=StepLR(0.1, 1, 0.5))
+        trainer.fit(train_data, train_labels, 2)
+        history = trainer.fit(train_data, train_labels, 2)
+
+        self.assertEqual([(logs["epoch"], logs["lr"]) for logs in history], [(0, 0.1), (1, 0.05)])
+
+    def test_checkpoint(self):
+        trained = model()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "epoch{epoch}.npy")
+            Trainer(trained, lr=0.1, callbacks=[Checkpoint(path, every=2)]).fit(train_data, train_labels, 4)
+
+            self.assertEqual(sorted(os.listdir(directory)), ["epoch1.npy", "epoch3.npy"])
+
+            restored = model(seed=1)
+            Checkpoint.load(restored, path.format(epoch=3))
+
+            for p, q in zip(trained.parameters(), restored.parameters()):
+                self.assertAlmostEqual(p.data, q.data)
+
+
+if __name__ == '__main__':
+    unittest.main()